@@ -11,6 +11,7 @@ Features:
 - Session-based user identity (enterprise-ready authentication model)
 - Role-Based Access Control (end_user vs service_desk_agent)
 - Full observability logging (user inputs, tool calls, agent responses)
+- Streaming responses (agent text is printed as it is generated)
 
 Architecture Flow:
     1. CLI argument parsing (user_id, role)
@@ -45,42 +46,56 @@ Author: SupportPilot Team
 
 import asyncio
 import argparse
+import contextlib
 import uuid
 import os
+import sys
+import threading
 import warnings
 import logging
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
 
 # --- LOG SUPPRESSION CONFIGURATION ---
 # Suppress unnecessary warnings and verbose logs from dependencies
 # This must be done BEFORE importing Google libraries
+
+# Dependency loggers that are only allowed to report errors
+QUIET_LOGGERS = (
+    "google_genai",
+    "google_genai.types",
+    "google.adk",
+    "google.genai",
+    "google.generativeai",
+    "absl",
+)
+
+# A single catch-all filter: it already covers DeprecationWarning,
+# FutureWarning, "non-text parts in the response" and "Default value is not
+# supported", and keeps the filter list that every warn() call scans short.
 warnings.filterwarnings("ignore")
 
-# Suppress specific warning categories
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-warnings.filterwarnings("ignore", category=FutureWarning)
-logging.getLogger("google_genai").setLevel(logging.ERROR)
-logging.getLogger("google_genai.types").setLevel(logging.ERROR)
-warnings.filterwarnings("ignore", message=".*non-text parts in the response.*")
-warnings.filterwarnings("ignore", message=".*Default value is not supported.*")
+for logger_name in QUIET_LOGGERS:
+    logging.getLogger(logger_name).setLevel(logging.ERROR)
 
 os.environ['GRPC_VERBOSITY'] = 'ERROR'
 os.environ['GLOG_minloglevel'] = '3'
 
-# Silence specific loggers
-logging.getLogger('google.adk').setLevel(logging.ERROR)
-logging.getLogger('google.genai').setLevel(logging.ERROR)
-logging.getLogger('google.generativeai').setLevel(logging.ERROR)
-logging.getLogger('absl').setLevel(logging.ERROR)
-
 # --- CORE IMPORTS ---
-from google.adk.runners import Runner
-from google.adk.sessions import DatabaseSessionService
-from google.genai import types
-
-from src.agents.orchestrator import get_orchestrator_agent
+# The Google ADK stack (protobuf/gRPC/absl) takes hundreds of milliseconds to
+# import. It is loaded on a worker thread by preload_adk() while the banner
+# and login prompt are already on screen; see main_loop().
 from src.utils.logger import setup_logger
 
+# Optional faster event loop (libuv-based, not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
 # --- APPLICATION CONFIGURATION ---
 load_dotenv()  # Load environment variables from .env file
 logger = setup_logger("SupportPilot_App")
@@ -88,18 +103,48 @@ logger = setup_logger("SupportPilot_App")
 # Application name (must match across all ADK components)
 APP_NAME = "agents"
 
-# Database URL for session persistence (SQLite)
-SESSION_DB_URL = f"sqlite:///{os.path.abspath('data/sessions.db')}"
+# Database URL for session persistence (SQLite through the async aiosqlite
+# driver, which is what DatabaseSessionService's async engine requires)
+SESSION_DB_FILE = os.path.abspath('data/sessions.db')
+SESSION_DB_URL = f"sqlite+aiosqlite:///{SESSION_DB_FILE}"
 
+# SQLite tuning for the session database (local, single-writer CLI):
+# WAL + synchronous=NORMAL avoids an fsync on every committed turn, the
+# larger page cache (8 MiB) keeps session/event pages hot between turns, and
+# mmap lets reads come straight from the OS page cache. foreign_keys=ON is
+# what DatabaseSessionService sets on engines it creates itself; it does not
+# touch an engine that is handed to it, so the pragma is repeated here.
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8192",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
 
-def print_banner():
-    """
-    Displays the SupportPilot welcome banner in the terminal.
-    
-    This provides a professional first impression and confirms the system
-    is running with persistent memory and role-based access control enabled.
-    """
-    print("""
+# Existence probe for returning users (reads at most one row from ADK's
+# sessions table, whose primary key starts with app_name, user_id)
+USER_HISTORY_SQL = (
+    "SELECT 1 FROM sessions "
+    "WHERE app_name = :app_name AND user_id = :user_id AND id != :session_id "
+    "LIMIT 1"
+)
+
+# Allowed RBAC roles mapped to their display names
+ROLES = {
+    "end_user": "End User",
+    "service_desk_agent": "Service Desk Agent",
+}
+DEFAULT_ROLE = "end_user"
+
+# Commands that terminate the conversation (matched case-insensitively)
+EXIT_CMDS = frozenset({"quit", "exit", "bye"})
+EXIT_CMD_MAX_LEN = max(map(len, EXIT_CMDS))  # Longer input can never match
+
+
+# Welcome banner, encoded once at import so it can be written in one call
+BANNER = """
 ======================================================
 ✈️  S U P P O R T P I L O T   A G E N T  ✈️
 ======================================================
@@ -114,10 +159,78 @@ Roles:
   - end_user: Create tickets, view own tickets
   - service_desk_agent: View all tickets, update status
 ======================================================
-""")
+
+"""
+BANNER_BYTES = BANNER.encode(sys.stdout.encoding or "utf-8", errors="replace")
+
+
+def print_banner():
+    """
+    Displays the SupportPilot welcome banner in the terminal.
+    
+    This provides a professional first impression and confirms the system
+    is running with persistent memory and role-based access control enabled.
+    
+    The pre-encoded banner is written to the binary stdout buffer with a
+    single write + flush. Falls back to print() when stdout has no binary
+    buffer (e.g., replaced by a StringIO in tests).
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(BANNER, end="")
+        return
+    
+    sys.stdout.flush()  # Keep ordering with any text already printed
+    buffer.write(BANNER_BYTES)
+    buffer.flush()
+
+
+def preload_adk() -> None:
+    """
+    Imports the Google ADK stack and the agent modules, and loads the
+    knowledge base search index.
+    
+    Meant to run on a worker thread during startup so the import cost overlaps
+    with the banner and login prompt. Later imports of the same modules in
+    main_loop() are then plain sys.modules lookups, and the first technical
+    question does not have to wait for the knowledge base to be parsed.
+    """
+    import google.adk.runners  # noqa: F401
+    import google.adk.sessions  # noqa: F401
+    import google.genai.types  # noqa: F401
+    import sqlalchemy.ext.asyncio  # noqa: F401
+    import src.agents.orchestrator  # noqa: F401
+    from src.tools.kb_tools import get_kb_index
+    
+    get_kb_index()
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Applies SQLITE_PRAGMAS to every new connection of the session database.
+    
+    Registered in main_loop() as a "connect" listener on the sync_engine of
+    the session engine only (the engine is created there and handed to
+    DatabaseSessionService), so no other engine in the process is affected.
+    
+    Args:
+        dbapi_connection: The DB-API connection that was just opened (the
+                          aiosqlite adapter, which exposes the usual
+                          cursor()/execute() interface).
+        connection_record: SQLAlchemy pool bookkeeping (unused).
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 
-async def check_user_history(session_service: DatabaseSessionService, user_id: str) -> bool:
+async def check_user_history(
+    session_engine: "AsyncEngine",
+    user_id: str,
+    current_session_id: str,
+    has_session_db: bool = True
+) -> bool:
     """
     Checks if a user has existing session history in the database.
     
@@ -126,44 +239,207 @@ async def check_user_history(session_service: DatabaseSessionService, user_id: s
     - Returning users: "Welcome back!"
     
     Args:
-        session_service (DatabaseSessionService): The session management service.
+        session_engine (AsyncEngine): The engine backing the session service.
         user_id (str): The user's unique identifier.
+        current_session_id (str): The session being started for this run. It is
+                                  ignored so the check can run concurrently
+                                  with its creation.
+        has_session_db (bool): Whether the sessions DB file existed before the
+                               session service was created. If it did not,
+                               there cannot be any history and the query is
+                               skipped entirely (first-ever launch).
     
     Returns:
         bool: True if the user has previous sessions, False otherwise.
     
+    Performance:
+        Uses a LIMIT 1 existence probe (USER_HISTORY_SQL) on the session
+        engine instead of list_sessions(), which would load every session the
+        user ever had just to test for emptiness. The query goes through the
+        engine's async driver, so it does not stall the event loop and needs
+        no worker thread.
+    
     Note:
-        This function suppresses exceptions to handle database initialization
-        scenarios gracefully (e.g., first-time setup).
+        The greeting is cosmetic, so any database error (schema not yet
+        initialized, locked file, driver or schema mismatch with the installed
+        ADK) is logged and treated as "no history" instead of aborting
+        startup. The engine is the AsyncEngine built in main_loop(), so the
+        async API used here always matches it.
     """
+    from sqlalchemy import text
+    from sqlalchemy.exc import SQLAlchemyError
+    
+    if not has_session_db:
+        return False
+    
     try:
-        response = await session_service.list_sessions(app_name=APP_NAME, user_id=user_id)
-        if response.sessions:
+        async with session_engine.connect() as conn:
+            row = (await conn.execute(
+                text(USER_HISTORY_SQL),
+                {
+                    "app_name": APP_NAME,
+                    "user_id": user_id,
+                    "session_id": current_session_id,
+                }
+            )).first()
+        if row is not None:
             return True
-    except Exception:
-        # Silently handle errors (e.g., database not yet initialized)
-        pass
+    except SQLAlchemyError as e:
+        # Database not usable (yet): greet the user as new
+        logger.warning(f"History check failed for {user_id}: {e}")
     return False
 
 
+async def read_input(prompt: str) -> str:
+    """
+    Reads a line from the terminal without blocking the event loop.
+    
+    The blocking input() call runs on a daemon thread, so the event loop stays
+    free to drive background work while the user is typing. A daemon thread
+    (rather than asyncio.to_thread) is used so that a prompt abandoned with
+    Ctrl+C never keeps the interpreter alive at shutdown.
+    
+    Args:
+        prompt (str): The prompt text displayed to the user.
+    
+    Returns:
+        str: The raw line entered by the user (without trailing newline).
+    
+    Raises:
+        EOFError: If stdin is closed (e.g., Ctrl+D).
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def _deliver(setter, value):
+        # The awaiting coroutine may have been cancelled in the meantime
+        if not future.done():
+            setter(value)
+    
+    def _reader():
+        try:
+            line = input(prompt)
+            callback = (_deliver, future.set_result, line)
+        except BaseException as e:
+            callback = (_deliver, future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            # Event loop already closed (application shutting down)
+            pass
+    
+    threading.Thread(target=_reader, name="stdin-reader", daemon=True).start()
+    return await future
+
+
+# --- EVENT PART HANDLERS ---
+# Each handler receives the populated field of an event part and the
+# per-turn buffer of agent text chunks.
+
+def _handle_function_call(function_call, response_parts: list) -> None:
+    """Event Type 1: Tool Call (Agent requesting tool execution)."""
+    # Visual feedback: processing dots
+    print(".", end="", flush=True)
+    
+    # Log tool invocation
+    logger.info(f"TOOL_CALL: {function_call.name} | Args: {function_call.args}")
+
+
+def _handle_function_response(function_response, response_parts: list) -> None:
+    """Event Type 2: Tool Response (Tool returning data to agent)."""
+    # Log tool output (for observability only - DO NOT PRINT).
+    # Stringifying a large tool response is only worth it if the record
+    # will actually be emitted.
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    response_data = function_response.response
+    if not isinstance(response_data, str):
+        response_data = repr(response_data)
+    
+    logger.info(
+        "TOOL_OUTPUT: %s | Response: %s...",
+        function_response.name,
+        response_data[:100]
+    )
+
+
+def _handle_text(text: str, response_parts: list) -> None:
+    """Event Type 3: Text Response (Agent's final/intermediate response)."""
+    # Fast path: whitespace-only chunks carry nothing to show
+    if text.isspace():
+        return
+    
+    text_clean = text.strip()
+    
+    # Skip the literal "None" the model sometimes emits (only a 4-char chunk
+    # can match, so normal text never pays for the lowercase copy)
+    if len(text_clean) != 4 or text_clean.lower() != "none":
+        # Each text event is a whole model response: start it on its own line
+        # (ends the dots, or the previous response of the same turn)
+        print()
+        
+        # Print the chunk as soon as it arrives (no buffering)
+        print(text, end="", flush=True)
+        response_parts.append(text_clean)
+
+
+def _handle_text_delta(text: str, response_parts: list, streamed: bool) -> bool:
+    """
+    Echoes a partial (SSE) text chunk as soon as the model produces it.
+    
+    The complete text of the same model response arrives afterwards in one
+    aggregated event, which is what gets buffered for logging.
+    
+    Args:
+        text (str): The text delta carried by the partial event.
+        response_parts (list): The per-turn buffer of agent text chunks.
+        streamed (bool): Whether a delta of this response is already on screen.
+    
+    Returns:
+        bool: The updated `streamed` flag.
+    """
+    if not streamed:
+        # Same filtering as _handle_text, applied to the opening chunk
+        if text.isspace():
+            return False
+        text_clean = text.strip()
+        if len(text_clean) == 4 and text_clean.lower() == "none":
+            return False
+        # A new model response starts: put it on its own line (after the
+        # dots, or after an earlier response of the same turn)
+        print()
+    
+    print(text, end="", flush=True)
+    return True
+
+
+# Checked in order; the first populated field wins (mirrors the old if/elif chain)
+PART_HANDLERS = (
+    ("function_call", _handle_function_call),
+    ("function_response", _handle_function_response),
+    ("text", _handle_text),
+)
+
+
 async def main_loop():
     """
     Main application loop that handles CLI arguments, authentication, and conversation.
     
     Flow:
         0. Parse CLI arguments (--user_id, --role)
-        1. Display banner
-        2. Initialize infrastructure (session service, orchestrator, runner)
-        3. Validate and set user role
-        4. User authentication (from CLI or interactive input)
-        5. Check user history (new vs returning)
-        6. Create fresh session with initial state (including role)
-        7. Enter conversation loop:
+        1. Validate and set user role
+        2. Display banner (ADK imports start loading in the background)
+        3. User authentication (from CLI or interactive input)
+        4. Initialize infrastructure (session service, orchestrator, runner)
+        5. Check user history (new vs returning) while creating a fresh
+           session with initial state (including role), concurrently
+        6. Enter conversation loop:
            - Accept user input
            - Process with agent
            - Display response
            - Log all events
-        8. Exit on quit command
+        7. Exit on quit command
     
     CLI Arguments:
         --user_id: User identifier (default: "guest", triggers interactive input)
@@ -189,7 +465,10 @@ async def main_loop():
     
     Error Handling:
         - KeyboardInterrupt (Ctrl+C): Graceful shutdown
-        - General exceptions: Logged and conversation terminates
+        - EOFError (stdin closed, e.g. Ctrl+D): Treated like 'quit'
+        - General exceptions: Logged (and shown, unless the next prompt is
+          already open); the failed turn is skipped and the conversation
+          continues with the next message
     """
     
     # === STEP 0: CLI ARGUMENT PARSING ===
@@ -211,47 +490,67 @@ async def main_loop():
     )
     args = parser.parse_args()
     
-    # Validate role against allowed values
-    allowed_roles = ["end_user", "service_desk_agent"]
-    user_role = args.role if args.role in allowed_roles else "end_user"
+    # Validate role against allowed values (one lookup yields validity + label)
+    role_display = ROLES.get(args.role)
+    user_role = args.role
     
     # Warn if invalid role was provided
-    if args.role not in allowed_roles:
-        print(f"⚠️  Warning: Invalid role '{args.role}'. Defaulting to 'end_user'.")
-        print(f"   Allowed roles: {', '.join(allowed_roles)}\n")
+    if role_display is None:
+        print(f"⚠️  Warning: Invalid role '{args.role}'. Defaulting to '{DEFAULT_ROLE}'.")
+        print(f"   Allowed roles: {', '.join(ROLES)}\n")
+        user_role = DEFAULT_ROLE
+        role_display = ROLES[DEFAULT_ROLE]
     
     print_banner()
     
-    # === STEP 1: INITIALIZE INFRASTRUCTURE ===
-    session_service = DatabaseSessionService(db_url=SESSION_DB_URL)
-    orchestrator = get_orchestrator_agent()
-    runner = Runner(
-        agent=orchestrator,
-        app_name=APP_NAME,
-        session_service=session_service
-    )
+    # Load the ADK stack in the background while the user logs in
+    adk_import = asyncio.create_task(asyncio.to_thread(preload_adk))
     
-    # === STEP 2: USER AUTHENTICATION ===
+    # === STEP 1: USER AUTHENTICATION ===
     # From CLI arguments, or interactive input if user_id is "guest"
     if args.user_id == "guest":
-        current_user_id = input("🔐 Enter User ID (default: guest): ").strip() or "guest"
+        current_user_id = (await read_input("🔐 Enter User ID (default: guest): ")).strip() or "guest"
     else:
         current_user_id = args.user_id
     
-    # === STEP 3: CHECK USER HISTORY ===
-    user_exists = await check_user_history(session_service, current_user_id)
+    # === STEP 2: INITIALIZE INFRASTRUCTURE ===
+    await adk_import
+    from google.adk.agents.run_config import RunConfig, StreamingMode
+    from google.adk.runners import Runner
+    from google.adk.sessions import DatabaseSessionService
+    from google.genai import types
+    from sqlalchemy import event as sa_event
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from src.agents.orchestrator import get_orchestrator_agent
+    from src.tools.ticket_tools import warm_up_db
     
-    # Format role for display
-    role_display = user_role.replace('_', ' ').title()
+    # Checked before the service creates the file (no file = no history)
+    has_session_db = os.path.exists(SESSION_DB_FILE)
     
-    if user_exists:
-        greeting = f"👋 Welcome back, {current_user_id}! (New Session Started)"
-    else:
-        greeting = f"👋 Hello {current_user_id}! Creating your profile..."
+    # The session engine is built here (rather than from a db_url inside the
+    # service) so the pragmas can be attached to it before its first connection
+    session_engine = create_async_engine(SESSION_DB_URL)
+    sa_event.listen(session_engine.sync_engine, "connect", apply_sqlite_pragmas)
     
-    # === STEP 4: CREATE NEW SESSION ===
+    session_service = DatabaseSessionService(db_engine=session_engine)
+    orchestrator = get_orchestrator_agent()
+    runner = Runner(
+        agent=orchestrator,
+        app_name=APP_NAME,
+        session_service=session_service
+    )
+    
+    # Open the tickets DB connection on this thread (where ADK runs the
+    # tools) and pull its pages into memory before the first request
+    warm_up_db()
+    
+    # Stream model output (SSE): text is printed token-by-token as it is
+    # generated instead of after the whole response is complete
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+    
+    # === STEP 3: PREPARE NEW SESSION ===
     # Each run starts with a clean session (fresh conversation context)
-    current_session_id = str(uuid.uuid4())
+    current_session_id = uuid.uuid4().hex  # 32 hex chars (no hyphens)
     
     # Initial session state (persistent across conversation)
     initial_state = {
@@ -260,30 +559,57 @@ async def main_loop():
         "user:role": user_role               # User role for RBAC
     }
     
-    await session_service.create_session(
-        app_name=APP_NAME,
-        user_id=current_user_id,
-        session_id=current_session_id,
-        state=initial_state
+    # === STEP 4: CHECK USER HISTORY + CREATE SESSION (concurrently) ===
+    # Both are independent DB round trips; the history check ignores the
+    # session being created so the two calls cannot race each other.
+    user_exists, _ = await asyncio.gather(
+        check_user_history(
+            session_engine, current_user_id, current_session_id, has_session_db
+        ),
+        session_service.create_session(
+            app_name=APP_NAME,
+            user_id=current_user_id,
+            session_id=current_session_id,
+            state=initial_state
+        )
     )
     
+    if user_exists:
+        greeting = f"👋 Welcome back, {current_user_id}! (New Session Started)"
+    else:
+        greeting = f"👋 Hello {current_user_id}! Creating your profile..."
+    
     print("-" * 60)
     print(f"🤖 SupportPilot: {greeting}")
     print(f"🔐 Role: {role_display}")
     logger.info(f"Session started | User: {current_user_id} | Role: {user_role}")
     
+    # Conversation prompt (user identity is fixed for the whole session)
+    prompt_str = f"\n👤 {current_user_id} > "
+    
+    # Pending read of the next message. It is started early, as soon as the
+    # agent's final answer is on screen, so the user can start typing while
+    # the runner drains any trailing events of the current turn.
+    next_input = None
+    
     # === STEP 5: CONVERSATION LOOP ===
     while True:
         try:
-            # Get user input
-            user_input = input(f"\n👤 {current_user_id} > ").strip()
+            # Get user input (reusing the read started during the last turn)
+            if next_input is None:
+                next_input = asyncio.ensure_future(read_input(prompt_str))
+            try:
+                user_input = (await next_input).strip()
+            finally:
+                next_input = None
             
             # Skip empty inputs
             if not user_input:
                 continue
             
             # Check for exit commands
-            if user_input.lower() in ["quit", "exit", "bye"]:
+            # (length test first: normal messages skip the lowercase copy)
+            if len(user_input) <= EXIT_CMD_MAX_LEN and user_input.lower() in EXIT_CMDS:
                 print("\n👋 Saving memory... Goodbye!")
                 logger.info(f"User {current_user_id} logged out.")
                 break  # Exit the loop and terminate the program
@@ -299,81 +625,99 @@ async def main_loop():
             
             # Visual feedback (processing indicator)
             print("🤖 SupportPilot ", end="", flush=True)
-            full_text = ""  # Accumulate agent response text
-            has_printed_newline = False  # Track if we've printed a newline after dots
+            response_parts = []  # Buffer agent text chunks (joined once at the end)
+            streamed = False     # Deltas of the current model response already printed
             
             # === STEP 6: EXECUTE AGENT ===
-            async for event in runner.run_async(
+            # aclosing() finalizes the runner right away if the turn is
+            # aborted (error/Ctrl+C) instead of whenever the generator is GC'd
+            async with contextlib.aclosing(runner.run_async(
                 user_id=current_user_id,
                 session_id=current_session_id,
-                new_message=content
-            ):
-                if event.content and event.content.parts:
-                    part = event.content.parts[0]
-                    
-                    # Event Type 1: Tool Call (Agent requesting tool execution)
-                    if part.function_call:
-                        # Visual feedback: processing dots
-                        print(".", end="", flush=True)
+                new_message=content,
+                run_config=run_config
+            )) as events:
+                async for event in events:
+                    # Resolve each attribute chain once per event (locals are
+                    # cheaper than repeated pydantic attribute lookups)
+                    event_content = event.content
+                    parts = event_content.parts if event_content else None
+                    if parts:
+                        part = parts[0]
+                        text = part.text
                         
-                        # Log tool invocation
-                        logger.info(
-                            f"TOOL_CALL: {part.function_call.name} | "
-                            f"Args: {part.function_call.args}"
-                        )
+                        if event.partial:
+                            # Streaming chunk: print it now, buffer nothing yet
+                            if text:
+                                streamed = _handle_text_delta(
+                                    text, response_parts, streamed
+                                )
+                        elif streamed and text:
+                            # Aggregated text of a response already streamed to
+                            # the screen: only buffer it for the log
+                            response_parts.append(text.strip())
+                            streamed = False
+                        else:
+                            # Dispatch on the first populated field of the part
+                            for field, handler in PART_HANDLERS:
+                                value = getattr(part, field)
+                                if value:
+                                    handler(value, response_parts)
+                                    break
                     
-                    # Event Type 2: Tool Response (Tool returning data to agent)
-                    elif part.function_response:
-                        # Log tool output (for observability only - DO NOT PRINT)
-                        response_data = part.function_response.response
-                        
-                        logger.info(
-                            f"TOOL_OUTPUT: {part.function_response.name} | "
-                            f"Response: {str(response_data)[:100]}..."
-                        )
-                    
-                    # Event Type 3: Text Response (Agent's final/intermediate response)
-                    elif part.text:
-                        text_clean = part.text.strip()
-                        
-                        # Only process non-empty, meaningful text
-                        if text_clean and text_clean.lower() != "none":
-                            # Print newline after dots (only once)
-                            if not has_printed_newline:
-                                print()  # New line after the dots
-                                has_printed_newline = True
-                            
-                            # Print the agent's response
-                            print(text_clean)
-                            full_text += text_clean
-                            
-                            # Log agent response
-                            logger.info(f"AGENT_RESPONSE: {text_clean}")
+                    # Answer complete: end the line and open the next prompt now
+                    if next_input is None and response_parts and event.is_final_response():
+                        print()
+                        next_input = asyncio.ensure_future(read_input(prompt_str))
             
-            # Handle silent completions (action completed without text output)
-            if not full_text:
+            # Terminate the streamed response line, or handle silent completions
+            # (action completed without text output)
+            if response_parts:
+                if next_input is None:
+                    print()
+                # Log the full agent response once per turn (one line per
+                # model response)
+                agent_response = "\n".join(response_parts)
+                logger.info(f"AGENT_RESPONSE: {agent_response}")
+            else:
                 print("\n⚠️  (No response from agent - check logs for details)")
         
-        except KeyboardInterrupt:
-            # User pressed Ctrl+C
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # User pressed Ctrl+C (asyncio.run cancels the task on SIGINT)
             print("\n⚠️  Interrupted by user.")
             logger.info(f"User {current_user_id} interrupted session.")
             break
         
+        except EOFError:
+            # Input stream closed: no further messages can be read
+            print("\n👋 Saving memory... Goodbye!")
+            logger.info(f"User {current_user_id} closed the input stream.")
+            break
+        
         except Exception as e:
-            # Unexpected error occurred
-            print(f"\n❌ Error: {e}")
+            # Unexpected error in this turn (e.g., model/API failure):
+            # report it and keep the session alive for the next message.
+            # If the answer is already on screen and the next prompt is open,
+            # the failure came from the trailing events: only log it, so the
+            # prompt the user is typing into is not overwritten.
+            if next_input is None:
+                print(f"\n❌ Error: {e}")
             logger.error(f"CRITICAL_ERROR: {e}")
-            break
+            continue
+    
+    # The service does not dispose of an engine it was handed
+    await session_engine.dispose()
 
 
 if __name__ == "__main__":
-    # Boot sequence: Verify logger is working
-    test_logger = setup_logger("BOOT_TEST")
-    test_logger.info("=== SupportPilot System Starting ===")
+    # Boot sequence
+    logger.info("=== SupportPilot System Starting ===")
     
-    # Run the main application loop
-    asyncio.run(main_loop())
+    # Run the main application loop (on uvloop when it is installed)
+    if uvloop is not None:
+        uvloop.run(main_loop())
+    else:
+        asyncio.run(main_loop())
     
     # Shutdown sequence
-    test_logger.info("=== SupportPilot System Shutdown ===")
\ No newline at end of file
+    logger.info("=== SupportPilot System Shutdown ===")
\ No newline at end of file
@@ -3,6 +3,7 @@ SupportPilot Data Layer Initialization Script
 
 This script initializes the foundational data structures for SupportPilot:
 1. Knowledge Base (JSON) - Contains IT troubleshooting solutions
+   (copied from data/knowledge_base.seed.json)
 2. Tickets Database (SQLite) - Stores support ticket records
 3. Sessions Database (SQLite) - Manages conversation memory (reset for clean state)
 
@@ -13,7 +14,7 @@ Author: SupportPilot Team
 License: MIT
 """
 
-import json
+import shutil
 import sqlite3
 import os
 
@@ -21,88 +22,37 @@ import os
 # Ensure the data directory exists
 os.makedirs("data", exist_ok=True)
 
+KB_SEED_FILE = "data/knowledge_base.seed.json"  # Source of truth for KB entries
 KB_FILE = "data/knowledge_base.json"
 TICKETS_DB_FILE = "data/tickets.db"
 SESSIONS_DB_FILE = "data/sessions.db"
 
+# Seeding pragmas: the DB is deleted and rebuilt on every run, so there is
+# nothing to protect with a rollback journal or fsync
+SEED_PRAGMAS = """
+PRAGMA journal_mode=MEMORY;
+PRAGMA synchronous=OFF;
+PRAGMA temp_store=MEMORY;
+"""
+
 
 # --- 1. GENERATE KNOWLEDGE BASE (JSON) ---
 def create_knowledge_base():
     """
-    Creates a JSON-based knowledge base containing common IT support solutions.
+    Creates the JSON-based knowledge base containing common IT support solutions.
     
     The knowledge base includes:
     - Issue categories (Hardware, Access, Software, Security, Email)
     - Search keywords for matching user queries
     - Step-by-step troubleshooting solutions
     
+    The entries live in a single checked-in seed file (KB_SEED_FILE); this
+    function copies it byte-for-byte, with no JSON encoding involved.
+    
     Output:
-        Creates/overwrites data/knowledge_base.json with 5 sample entries.
+        Creates/overwrites data/knowledge_base.json with the seed entries.
     """
-    kb_data = [
-        {
-            "id": 101,
-            "category": "Hardware",
-            "issue": "Printer not responding or printing",
-            "keywords": ["printer", "print", "paper", "jam", "offline"],
-            "solution": (
-                "1. Check if the printer is turned on and connected to the network.\n"
-                "2. Restart the printer.\n"
-                "3. Clear the print queue on your computer.\n"
-                "4. Check for paper jams."
-            )
-        },
-        {
-            "id": 102,
-            "category": "Access",
-            "issue": "VPN Connection Failed",
-            "keywords": ["vpn", "connection", "network", "remote", "access"],
-            "solution": (
-                "1. Ensure you have an active internet connection.\n"
-                "2. Verify your MFA token is correct.\n"
-                "3. Try switching the VPN protocol in settings to TCP.\n"
-                "4. Reinstall the VPN client if the issue persists."
-            )
-        },
-        {
-            "id": 103,
-            "category": "Software",
-            "issue": "Application crashing on startup",
-            "keywords": ["crash", "app", "software", "freeze", "close"],
-            "solution": (
-                "1. Check for software updates.\n"
-                "2. Clear the application cache/temporary files.\n"
-                "3. Restart your computer.\n"
-                "4. If critical, request a reinstall via ticket."
-            )
-        },
-        {
-            "id": 104,
-            "category": "Security",
-            "issue": "Password Reset Instructions",
-            "keywords": ["password", "reset", "login", "forgot", "account"],
-            "solution": (
-                "1. Go to the self-service portal at portal.company.com.\n"
-                "2. Click 'Forgot Password'.\n"
-                "3. Enter your employee ID.\n"
-                "4. Follow the SMS verification steps."
-            )
-        },
-        {
-            "id": 105,
-            "category": "Email",
-            "issue": "Outlook not syncing",
-            "keywords": ["email", "outlook", "sync", "receiving", "sending"],
-            "solution": (
-                "1. Check internet connection.\n"
-                "2. Look for the 'Working Offline' toggle in the Send/Receive tab and turn it off.\n"
-                "3. Close and reopen Outlook."
-            )
-        }
-    ]
-
-    with open(KB_FILE, 'w', encoding='utf-8') as f:
-        json.dump(kb_data, f, indent=4)
+    shutil.copyfile(KB_SEED_FILE, KB_FILE)
     
     print(f"✅ [OK] Knowledge Base created/reset: {KB_FILE}")
 
@@ -122,14 +72,27 @@ def create_ticket_db():
     
     Output:
         Creates data/tickets.db with sample seed data.
+    
+    Performance:
+        Schema creation and seeding run in a single transaction with
+        durability relaxed (SEED_PRAGMAS), so the whole build costs one commit.
     """
     # Remove old database if it exists (factory reset)
     if os.path.exists(TICKETS_DB_FILE):
         os.remove(TICKETS_DB_FILE)
         print(f"🗑️  [OK] Deleted old Tickets DB: {TICKETS_DB_FILE}")
+    
+    # WAL mode (see src/tools/ticket_tools.py) leaves sidecar files next to the DB
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(TICKETS_DB_FILE + suffix):
+            os.remove(TICKETS_DB_FILE + suffix)
 
     conn = sqlite3.connect(TICKETS_DB_FILE)
     cursor = conn.cursor()
+    cursor.executescript(SEED_PRAGMAS)
+
+    # One transaction for schema + seed data (committed once below)
+    cursor.execute("BEGIN")
 
     # Create tickets table
     create_table_sql = """
@@ -177,6 +140,10 @@ def reset_session_db():
     if os.path.exists(SESSIONS_DB_FILE):
         try:
             os.remove(SESSIONS_DB_FILE)
+            # WAL mode (see main.py) leaves sidecar files next to the DB
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(SESSIONS_DB_FILE + suffix):
+                    os.remove(SESSIONS_DB_FILE + suffix)
             print(f"✅ [OK] Deleted Session Memory: {SESSIONS_DB_FILE}")
         except OSError as e:
             print(f"⚠️  [WARN] Could not delete sessions DB (maybe in use?): {e}")
@@ -17,7 +17,10 @@ Architecture:
 Author: SupportPilot Team
 """
 
+import functools
+
 from google.adk.agents.llm_agent import LlmAgent
+from src.agents.model import get_model, constant_instruction
 from src.tools.kb_tools import search_knowledge_base
 
 
@@ -97,17 +100,22 @@ YOU: "I don't have information about that in my knowledge base. Would you like m
 
 REMEMBER: Always check the "status" field first, then use the "message" field to respond!
 """
+@functools.lru_cache(maxsize=None)
 def get_knowledge_agent() -> LlmAgent:
     """
     Factory function that creates and returns the Knowledge Agent instance.
     
+    The agent is built on first call and cached: every later call returns
+    the same instance. The agent holds no per-session state (that lives in
+    the session service), so it is safe to share across sessions.
+    
     The Knowledge Agent is configured with:
     - Model: gemini-2.5-flash-lite (fast, cost-efficient for search tasks)
     - Tool: search_knowledge_base (accesses the JSON knowledge base)
     - Instruction: Specialized prompt for KB-based troubleshooting
     
     Returns:
-        LlmAgent: Configured Knowledge Agent ready to process technical queries.
+        LlmAgent: The shared Knowledge Agent ready to process technical queries.
     
     Usage:
         This agent is typically invoked by the Orchestrator:
@@ -121,12 +129,12 @@ def get_knowledge_agent() -> LlmAgent:
         - Tool returns structured dictionaries for reliable parsing
     """
     return LlmAgent(
-        model='gemini-2.5-flash-lite', 
+        model=get_model(),  # Shared instance (one genai Client per process)
         name='knowledge_agent',
         description=(
             "Searches the Knowledge Base to solve technical issues "
             "(VPN, Printer, WiFi, Software, Email, etc.)."
         ),
-        instruction=INSTRUCTION,
+        instruction=constant_instruction(INSTRUCTION),  # Byte-stable prompt prefix
         tools=[search_knowledge_base]
     )
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Shared LLM Model for SupportPilot Agents
+
+This module provides the single Gemini model instance used by every agent
+in the multi-agent system (Orchestrator, Knowledge Agent, Ticket Agent),
+and the helper that hands their static system prompts to ADK.
+
+Why a shared instance:
+    When an LlmAgent is configured with a model *name* (a plain string),
+    ADK resolves it to a Gemini object once per agent and caches it on that
+    agent (canonical_model). Each of those objects lazily builds its own
+    google.genai Client (HTTP connection pool, auth), so three agents mean
+    three clients. Passing one shared Gemini object to all agents means a
+    single client is created per process and its connections are reused
+    across agents (the orchestrator and the agent it delegates to talk to
+    the same model within one turn).
+
+Why constant instructions:
+    A plain-string instruction is scanned by ADK on every model call for
+    {state_key} placeholders to substitute. None of the SupportPilot prompts
+    use templating, and any per-user text injected there would change the
+    start of every request. Passing the prompt through constant_instruction()
+    skips the scan and guarantees a byte-identical system prompt prefix,
+    which is what Gemini's implicit prompt caching matches on.
+
+Usage:
+    from src.agents.model import get_model, constant_instruction
+
+    agent = LlmAgent(
+        model=get_model(),
+        instruction=constant_instruction(INSTRUCTION),
+        ...
+    )
+
+Author: SupportPilot Team
+"""
+
+import functools
+from typing import Callable
+
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.models.google_llm import Gemini
+
+
+# Model used by all SupportPilot agents (fast, cost-efficient)
+MODEL_NAME = 'gemini-2.5-flash-lite'
+
+
+@functools.lru_cache(maxsize=None)
+def get_model(model_name: str = MODEL_NAME) -> Gemini:
+    """
+    Returns the shared Gemini model instance for the given model name.
+
+    The instance is created on first use and cached for the lifetime of the
+    process, so every agent using the same model name shares one underlying
+    google.genai Client.
+
+    Args:
+        model_name (str): The Gemini model identifier.
+                          Defaults to MODEL_NAME ('gemini-2.5-flash-lite').
+
+    Returns:
+        Gemini: The cached ADK model wrapper for `model_name`.
+
+    Example:
+        >>> get_model() is get_model()
+        True
+    """
+    return Gemini(model=model_name)
+
+
+def constant_instruction(text: str) -> Callable[[ReadonlyContext], str]:
+    """
+    Wraps a constant system prompt as an ADK instruction provider.
+    
+    ADK sends the text returned by an instruction provider verbatim (no
+    session-state placeholder substitution), so the prompt is identical,
+    byte for byte, on every request.
+    
+    Args:
+        text (str): The agent's system prompt (must not rely on {state}
+                    templating).
+    
+    Returns:
+        Callable[[ReadonlyContext], str]: Provider returning `text` unchanged.
+    """
+    def provider(ctx: ReadonlyContext) -> str:
+        return text
+    
+    return provider
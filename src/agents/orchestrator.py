@@ -25,9 +25,12 @@ Architecture:
 Author: SupportPilot Team
 """
 
+import functools
+
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.tools import AgentTool
 
+from src.agents.model import get_model, constant_instruction
 from src.agents.knowledge_agent import get_knowledge_agent
 from src.agents.ticket_agent import get_ticket_agent
 from src.tools.session_tools import get_my_info
@@ -140,6 +143,7 @@ SupportPilot: [calls ticket_agent]
 SupportPilot: [relays ticket_agent response - ticket_agent knows user is service_desk_agent]
 """
 
+@functools.lru_cache(maxsize=None)
 def get_orchestrator_agent() -> LlmAgent:
     """
     Factory function that creates and returns the Orchestrator Agent instance.
@@ -148,8 +152,11 @@ def get_orchestrator_agent() -> LlmAgent:
     SupportPilot system. It instantiates sub-agents and exposes them as tools
     using AgentTool.
     
+    Like the sub-agent factories, it is memoized: the agent tree is built on
+    first call and every later call (e.g., one Runner per session) reuses it.
+    
     Returns:
-        LlmAgent: Configured Orchestrator Agent with sub-agents attached.
+        LlmAgent: The shared Orchestrator Agent with sub-agents attached.
     
     Architecture:
         The Orchestrator uses a multi-agent pattern where specialized agents
@@ -186,10 +193,10 @@ def get_orchestrator_agent() -> LlmAgent:
     
     # Create and return the orchestrator with sub-agents wrapped as AgentTools
     return LlmAgent(
-        model='gemini-2.5-flash-lite', 
+        model=get_model(),  # Shared instance (one genai Client per process)
         name='support_pilot_orchestrator',
         description="Main coordinator. Routes requests and manages user identity.",
-        instruction=ORCHESTRATOR_INSTRUCTION,
+        instruction=constant_instruction(ORCHESTRATOR_INSTRUCTION),  # Byte-stable prompt prefix
         tools=[
             AgentTool(knowledge_bot),  # Wrap agents with AgentTool
             AgentTool(ticket_bot),
@@ -23,7 +23,10 @@ Architecture:
 Author: SupportPilot Team
 """
 
+import functools
+
 from google.adk.agents.llm_agent import LlmAgent
+from src.agents.model import get_model, constant_instruction
 from src.tools.ticket_tools import (
     create_ticket, 
     get_ticket_by_id,
@@ -115,10 +118,16 @@ YOU: "I'm sorry, but only service desk agents can update ticket status. Your tic
 CRITICAL: Tools handle all permission logic. Just call the right tool and present the result clearly!
 """
 
+@functools.lru_cache(maxsize=None)
 def get_ticket_agent() -> LlmAgent:
     """
     Factory function that creates and returns the Ticket Agent instance.
     
+    The agent is built on first call and cached: every later call returns
+    the same instance. The agent holds no per-session state (user identity
+    and role are read from session state by the tools), so it is safe to
+    share across sessions.
+    
     The Ticket Agent is configured with:
     - Model: gemini-2.5-flash-lite (efficient for straightforward CRUD operations)
     - Tools (4 total - all return structured dictionaries):
@@ -129,7 +138,7 @@ def get_ticket_agent() -> LlmAgent:
     - Instruction: Clear tool selection guide with dictionary handling
     
     Returns:
-        LlmAgent: Configured Ticket Agent ready to manage support tickets.
+        LlmAgent: The shared Ticket Agent ready to manage support tickets.
     
     Usage:
         This agent is typically invoked by the Orchestrator:
@@ -150,13 +159,13 @@ def get_ticket_agent() -> LlmAgent:
         - Removed "pass-through" mode (no longer needed with proper dict returns)
     """
     return LlmAgent(
-        model='gemini-2.5-flash-lite', 
+        model=get_model(),  # Shared instance (one genai Client per process)
         name='ticket_agent',
         description=(
             "Manages support tickets with 4 tools that return structured dictionaries: "
             "create, get by ID, list all (role-filtered), and update status."
         ),
-        instruction=INSTRUCTION,
+        instruction=constant_instruction(INSTRUCTION),  # Byte-stable prompt prefix
         tools=[
             create_ticket,
             get_ticket_by_id,
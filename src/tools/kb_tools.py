@@ -13,12 +13,25 @@ The knowledge base is stored as a JSON file containing:
 Tools:
     - search_knowledge_base: Searches for solutions based on user query
 
+Performance:
+    The JSON file is parsed once and turned into an in-memory index
+    (keyword -> entry positions, lowercased issue texts, ready-made result
+    entries). The index is rebuilt only when the file's modification time
+    changes (e.g., after running setup_data.py), so a search no longer
+    re-reads the file or re-lowercases every keyword.
+
 Author: SupportPilot Team
 """
 
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+# Optional C-accelerated JSON parser (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import logger for enhanced observability
 from src.utils.logger import setup_logger
@@ -30,6 +43,9 @@ KB_PATH = os.path.join(BASE_DIR, 'data', 'knowledge_base.json')
 # Initialize logger for this module
 logger = setup_logger("KBTools")
 
+# Cached search index as (file mtime, index); see get_kb_index()
+_kb_index: Optional[Tuple[int, Dict[str, Any]]] = None
+
 
 def load_kb() -> List[Dict[str, Any]]:
     """
@@ -46,12 +62,19 @@ def load_kb() -> List[Dict[str, Any]]:
                               
                               Returns an empty list if the file is not found.
     
+    Note:
+        Uses orjson for parsing when it is installed (faster, fewer
+        allocations); otherwise the stdlib json module.
+    
     Example:
         >>> kb = load_kb()
         >>> print(kb[0]['issue'])
         'Printer not responding or printing'
     """
     try:
+        if orjson is not None:
+            with open(KB_PATH, 'rb') as f:
+                return orjson.loads(f.read())
         with open(KB_PATH, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -62,6 +85,70 @@ def load_kb() -> List[Dict[str, Any]]:
         return []
 
 
+def build_kb_index(kb_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Precomputes the lookup structures used by search_knowledge_base.
+    
+    Args:
+        kb_data (List[Dict[str, Any]]): Knowledge base entries (see load_kb).
+    
+    Returns:
+        Dict[str, Any]: The search index:
+                        - entries: Result entries (id, issue, solution,
+                          category) in knowledge base order
+                        - keywords: Lowercased keyword -> list of entry
+                          positions that declare it
+                        - issues: Lowercased issue description per entry
+    """
+    entries = []
+    keywords: Dict[str, List[int]] = {}
+    issues = []
+    
+    for position, entry in enumerate(kb_data):
+        entries.append({
+            "id": entry.get('id'),
+            "issue": entry.get('issue'),
+            "solution": entry.get('solution'),
+            "category": entry.get('category')
+        })
+        issues.append(entry.get('issue', '').lower())
+        
+        for keyword in entry.get('keywords', []):
+            positions = keywords.setdefault(keyword.lower(), [])
+            if not positions or positions[-1] != position:
+                positions.append(position)
+    
+    return {"entries": entries, "keywords": keywords, "issues": issues}
+
+
+def get_kb_index() -> Dict[str, Any]:
+    """
+    Returns the search index for the current knowledge base file.
+    
+    The index is built on first use and cached together with the file's
+    modification time; it is rebuilt only when the file changes on disk.
+    A missing file is never cached (load_kb reports it and an empty index
+    is returned).
+    
+    Returns:
+        Dict[str, Any]: The search index (see build_kb_index).
+    """
+    global _kb_index
+    
+    try:
+        mtime = os.stat(KB_PATH).st_mtime_ns
+    except OSError:
+        return build_kb_index(load_kb())
+    
+    cached = _kb_index
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    index = build_kb_index(load_kb())
+    _kb_index = (mtime, index)
+    return index
+
+
 def search_knowledge_base(query: str) -> dict:
     """
     Searches the knowledge base for solutions based on a user query.
@@ -115,49 +202,43 @@ def search_knowledge_base(query: str) -> dict:
         "ISSUE: Printer not responding or printing\nSOLUTION: 1. Check if the printer is turned on..."
     """
     # Enhanced logging: Log function entry
-    logger.info(f"[TOOL_CALL] search_knowledge_base | Query: {query[:50]}...")
+    # (%-style: the 50-char preview is cut by the formatter, only if emitted)
+    logger.info("[TOOL_CALL] search_knowledge_base | Query: %.50s...", query)
     
-    # Load the knowledge base
-    kb_data = load_kb()
+    # Load the (cached) knowledge base index
+    kb_index = get_kb_index()
     
     # Normalize query to lowercase for case-insensitive matching
     query_lower = query.lower()
-    results = []
-    
-    # Search through each knowledge base entry
-    for entry in kb_data:
-        # Strategy 1: Check if any keyword exists in the query
-        keywords_match = any(
-            k.lower() in query_lower 
-            for k in entry.get('keywords', [])
-        )
-        
-        # Strategy 2: Check if the query text appears in the issue description
-        issue_match = query_lower in entry.get('issue', '').lower()
-        
-        # If either match succeeds, add to results
-        if keywords_match or issue_match:
-            result_entry = {
-                "id": entry.get('id'),
-                "issue": entry.get('issue'),
-                "solution": entry.get('solution'),
-                "category": entry.get('category')
-            }
-            results.append(result_entry)
+    matched = set()
+    
+    # Strategy 1: Check which keywords exist in the query (each distinct
+    # keyword is tested once, then mapped to the entries declaring it)
+    for keyword, positions in kb_index["keywords"].items():
+        if keyword in query_lower:
+            matched.update(positions)
+    
+    # Strategy 2: Check if the query text appears in the issue description
+    for position, issue in enumerate(kb_index["issues"]):
+        if query_lower in issue:
+            matched.add(position)
     
     # Return appropriate response
-    if not results:
+    if not matched:
         result = {
             "status": "not_found",
             "count": 0,
             "results": [],
             "message": "No solutions found in the knowledge base for your query. You may need to create a support ticket for further assistance."
         }
-        logger.info(f"[TOOL_RETURN] search_knowledge_base | No results found for query")
+        logger.info("[TOOL_RETURN] search_knowledge_base | No results found for query")
         return result
     
-    # Return the top 2 results to avoid overwhelming the agent's context window
-    top_results = results[:2]
+    # Return the top 2 results (in knowledge base order) to avoid
+    # overwhelming the agent's context window. Copies keep the cached
+    # entries safe from callers that modify the result.
+    entries = kb_index["entries"]
+    top_results = [dict(entries[position]) for position in sorted(matched)[:2]]
     
     # Format message for display
     message_parts = []
@@ -177,8 +258,8 @@ def search_knowledge_base(query: str) -> dict:
     
     # Enhanced logging: Log function exit
     logger.info(
-        f"[TOOL_RETURN] search_knowledge_base | "
-        f"Success: Found {len(top_results)} result(s)"
+        "[TOOL_RETURN] search_knowledge_base | Success: Found %d result(s)",
+        len(top_results)
     )
     
     return result
\ No newline at end of file
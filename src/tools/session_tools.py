@@ -84,8 +84,8 @@ def get_my_info(tool_context: ToolContext) -> Dict[str, str]:
     
     # Enhanced logging: Log function entry
     logger.info(
-        f"[TOOL_CALL] get_my_info | "
-        f"User: {user_id} | Role: {role}"
+        "[TOOL_CALL] get_my_info | User: %s | Role: %s",
+        user_id, role
     )
     
     # Format role for display (convert snake_case to Title Case)
@@ -102,8 +102,8 @@ def get_my_info(tool_context: ToolContext) -> Dict[str, str]:
     
     # Enhanced logging: Log function exit
     logger.info(
-        f"[TOOL_RETURN] get_my_info | "
-        f"Success: Returned info for {user_id} ({role})"
+        "[TOOL_RETURN] get_my_info | Success: Returned info for %s (%s)",
+        user_id, role
     )
     
     return result
\ No newline at end of file
@@ -25,6 +25,7 @@ Author: SupportPilot Team
 
 import sqlite3
 import os
+import threading
 from typing import Optional
 
 # Import ADK's ToolContext to access session state
@@ -40,20 +41,97 @@ DB_PATH = os.path.join(BASE_DIR, 'data', 'tickets.db')
 # Initialize logger for this module
 logger = setup_logger("TicketTools")
 
+# Per-connection SQLite tuning (applied once, when the connection is opened)
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # Read pages via mmap (up to 256 MiB)
+)
+
+# Allowed ticket statuses (must match the CHECK constraint in setup_data.py)
+VALID_STATUSES = ('Open', 'In Progress', 'Closed')
+
+# Case-insensitive lookup: lowercased status -> canonical spelling
+STATUS_BY_LOWER = {status.lower(): status for status in VALID_STATUSES}
+
+# Schema probe: a connection is only cached once the tickets table exists
+TICKETS_TABLE_SQL = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tickets'"
+
+# One long-lived connection per thread (sqlite3 connections are thread-bound),
+# stored together with the identity of the file it was opened on
+_local = threading.local()
+
 
 def get_db_connection() -> sqlite3.Connection:
     """
-    Establishes a connection to the SQLite tickets database.
+    Returns the SQLite tickets database connection for the current thread.
+    
+    The connection is opened (and tuned with DB_PRAGMAS) on first use and then
+    reused by every tool call on the same thread, so SQLite's page cache stays
+    warm and tool calls do not pay connect/teardown costs.
+    
+    The cached connection is only reused while DB_PATH still refers to the
+    same file (one stat() per call): if setup_data.py deleted and recreated
+    the database, a new connection is opened on the new file. A connection
+    to a database without the tickets table (not set up yet) is returned
+    but not cached, so the next call sees the table once it is created.
     
     Returns:
         sqlite3.Connection: Active database connection with Row factory enabled
                            for dictionary-like row access.
+    
+    Note:
+        Callers must not close the connection. Writes should run inside
+        `with conn:` so they are committed, or rolled back on error, without
+        leaving a transaction open on the shared connection.
     """
+    try:
+        st = os.stat(DB_PATH)
+        file_id = (st.st_dev, st.st_ino)
+    except FileNotFoundError:
+        file_id = None
+    
+    cached = getattr(_local, "conn", None)
+    if cached is not None:
+        conn, cached_id = cached
+        if cached_id == file_id:
+            return conn
+        # Database file was replaced or removed: drop the stale connection
+        _local.conn = None
+        conn.close()
+    
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row  # Enable column access by name
+    if file_id is None or conn.execute(TICKETS_TABLE_SQL).fetchone() is None:
+        # Not set up yet (possibly an empty file sqlite3 just created)
+        return conn
+    
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+    _local.conn = (conn, file_id)
     return conn
 
 
+def warm_up_db() -> None:
+    """
+    Opens the current thread's connection and faults the tickets table in.
+    
+    Called once at startup on the thread that will run the tools, so the
+    user's first ticket request does not pay for opening the connection and
+    reading cold pages from disk. Does nothing if the database has not been
+    created yet (see setup_data.py); errors are logged, never raised.
+    """
+    if not os.path.exists(DB_PATH):
+        return
+    
+    try:
+        get_db_connection().execute("SELECT count(*) FROM tickets").fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"Tickets DB warm-up failed: {e}")
+
+
 def create_ticket(
     issue_summary: str,
     tool_context: ToolContext
@@ -103,10 +181,10 @@ def create_ticket(
     role = tool_context.state.get("user:role", "end_user")
     
     # Enhanced logging: Log function entry
+    # (%-style: the 50-char preview is cut by the formatter, only if emitted)
     logger.info(
-        f"[TOOL_CALL] create_ticket | "
-        f"User: {real_user_id} | Role: {role} | "
-        f"Issue: {issue_summary[:50]}..."
+        "[TOOL_CALL] create_ticket | User: %s | Role: %s | Issue: %.50s...",
+        real_user_id, role, issue_summary
     )
     
     if not real_user_id:
@@ -123,19 +201,18 @@ def create_ticket(
     # 3. Insert ticket into database
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
         
-        cursor.execute(
-            """
-            INSERT INTO tickets (user_id, issue_summary, priority, status)
-            VALUES (?, ?, ?, ?)
-            """,
-            (real_user_id, issue_summary, priority, 'Open')
-        )
+        # Commits on success, rolls back on error (connection stays open)
+        with conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO tickets (user_id, issue_summary, priority, status)
+                VALUES (?, ?, ?, ?)
+                """,
+                (real_user_id, issue_summary, priority, 'Open')
+            )
         
         ticket_id = cursor.lastrowid  # Get the newly created ticket's ID
-        conn.commit()
-        conn.close()
         
         result = {
             "status": "success",
@@ -144,8 +221,8 @@ def create_ticket(
         
         # Enhanced logging: Log function exit with result
         logger.info(
-            f"[TOOL_RETURN] create_ticket | "
-            f"Success: Ticket #{ticket_id} created for {real_user_id}"
+            "[TOOL_RETURN] create_ticket | Success: Ticket #%s created for %s",
+            ticket_id, real_user_id
         )
         
         return result
@@ -218,8 +295,8 @@ def get_ticket_by_id(ticket_id: str, tool_context: ToolContext) -> dict:
     
     # Enhanced logging: Log function entry
     logger.info(
-        f"[TOOL_CALL] get_ticket_by_id | "
-        f"Ticket ID: {ticket_id} | User: {user_id} | Role: {role}"
+        "[TOOL_CALL] get_ticket_by_id | Ticket ID: %s | User: %s | Role: %s",
+        ticket_id, user_id, role
     )
     
     if not user_id:
@@ -245,7 +322,6 @@ def get_ticket_by_id(ticket_id: str, tool_context: ToolContext) -> dict:
         )
         
         ticket = cursor.fetchone()
-        conn.close()
         
         # 3. Check if ticket exists
         if not ticket:
@@ -284,9 +360,9 @@ def get_ticket_by_id(ticket_id: str, tool_context: ToolContext) -> dict:
         
         # Enhanced logging: Log function exit with result summary
         logger.info(
-            f"[TOOL_RETURN] get_ticket_by_id | "
-            f"Success: Returned ticket #{ticket_id} ({ticket['status']}) "
-            f"to {user_id} ({role})"
+            "[TOOL_RETURN] get_ticket_by_id | "
+            "Success: Returned ticket #%s (%s) to %s (%s)",
+            ticket_id, ticket['status'], user_id, role
         )
         
         return result
@@ -353,8 +429,8 @@ def list_all_tickets(tool_context: ToolContext) -> dict:
     
     # Enhanced logging: Log function entry
     logger.info(
-        f"[TOOL_CALL] list_all_tickets | "
-        f"User: {user_id} | Role: {role}"
+        "[TOOL_CALL] list_all_tickets | User: %s | Role: %s",
+        user_id, role
     )
     
     if not user_id:
@@ -395,7 +471,6 @@ def list_all_tickets(tool_context: ToolContext) -> dict:
             logger.debug(f"[SQL] Fetching tickets for user: {user_id} (end_user)")
         
         tickets = cursor.fetchall()
-        conn.close()
         
         # 3. Format response - clean structured data only
         ticket_list = []
@@ -419,8 +494,9 @@ def list_all_tickets(tool_context: ToolContext) -> dict:
         
         # Enhanced logging: Log function exit with result summary
         logger.info(
-            f"[TOOL_RETURN] list_all_tickets | "
-            f"Success: Returned {len(tickets)} ticket(s) to {user_id} ({role})"
+            "[TOOL_RETURN] list_all_tickets | "
+            "Success: Returned %d ticket(s) to %s (%s)",
+            len(tickets), user_id, role
         )
         
         return result
@@ -498,9 +574,9 @@ def update_ticket_status(
     
     # Enhanced logging: Log function entry
     logger.info(
-        f"[TOOL_CALL] update_ticket_status | "
-        f"Ticket ID: {ticket_id} | New Status: {new_status} | "
-        f"User: {user_id} | Role: {role}"
+        "[TOOL_CALL] update_ticket_status | "
+        "Ticket ID: %s | New Status: %s | User: %s | Role: %s",
+        ticket_id, new_status, user_id, role
     )
     
     # 2. Check user role (RBAC enforcement)
@@ -516,18 +592,13 @@ def update_ticket_status(
         return error_result
     
     # 3. Validate status (case-insensitive matching)
-    valid_states = ['Open', 'In Progress', 'Closed']
-    
     # Find the correctly capitalized version of the input status
-    matched_status = next(
-        (s for s in valid_states if s.lower() == new_status.lower()),
-        None
-    )
+    matched_status = STATUS_BY_LOWER.get(new_status.lower())
     
     if not matched_status:
         error_result = {
             "status": "error",
-            "error_message": f"Invalid status '{new_status}'. Allowed statuses are: {', '.join(valid_states)}."
+            "error_message": f"Invalid status '{new_status}'. Allowed statuses are: {', '.join(VALID_STATUSES)}."
         }
         logger.warning(f"[TOOL_RETURN] update_ticket_status | {error_result}")
         return error_result
@@ -540,7 +611,6 @@ def update_ticket_status(
         # Check if ticket exists
         cursor.execute("SELECT id FROM tickets WHERE id = ?", (ticket_id,))
         if not cursor.fetchone():
-            conn.close()
             error_result = {
                 "status": "error",
                 "error_message": f"Ticket ID {ticket_id} not found."
@@ -548,14 +618,12 @@ def update_ticket_status(
             logger.warning(f"[TOOL_RETURN] update_ticket_status | {error_result}")
             return error_result
         
-        # Perform update
-        cursor.execute(
-            "UPDATE tickets SET status = ? WHERE id = ?",
-            (matched_status, ticket_id)
-        )
-        
-        conn.commit()
-        conn.close()
+        # Perform update (commits on success, rolls back on error)
+        with conn:
+            conn.execute(
+                "UPDATE tickets SET status = ? WHERE id = ?",
+                (matched_status, ticket_id)
+            )
         
         result = {
             "status": "success",
@@ -565,8 +633,9 @@ def update_ticket_status(
         
         # Enhanced logging: Log function exit with result
         logger.info(
-            f"[TOOL_RETURN] update_ticket_status | "
-            f"Success: Ticket #{ticket_id} updated to '{matched_status}' by {user_id}"
+            "[TOOL_RETURN] update_ticket_status | "
+            "Success: Ticket #%s updated to '%s' by %s",
+            ticket_id, matched_status, user_id
         )
         
         return result
@@ -11,6 +11,11 @@ console and file. It supports observability by capturing:
 The log file is stored in the 'logs/' directory and follows a structured
 format suitable for analysis and debugging.
 
+Records are written asynchronously: every logger only puts its records on
+a shared in-memory queue, and a single background thread (QueueListener)
+writes them to the log file. Logging calls on the conversation hot path
+therefore never wait on disk I/O. The queue is flushed at interpreter exit.
+
 Usage:
     from src.utils.logger import setup_logger
     
@@ -21,11 +26,60 @@ Usage:
 Author: SupportPilot Team
 """
 
+import atexit
+import functools
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+# Log destination (relative to the working directory)
+LOG_DIR = "logs"
+LOG_FILE = os.path.join(LOG_DIR, "support_pilot.log")
+
+
+@functools.lru_cache(maxsize=None)
+def get_log_queue() -> queue.SimpleQueue:
+    """
+    Returns the queue shared by all SupportPilot loggers.
+    
+    On first call this creates the log directory, the single file handler
+    for LOG_FILE and a QueueListener thread that drains the queue into it,
+    and prints a one-time confirmation. The listener is stopped at
+    interpreter exit, which writes out any records still queued.
+    
+    Returns:
+        queue.SimpleQueue: The queue that QueueHandlers push records to.
+    """
+    # Ensure the 'logs' directory exists in the project root
+    os.makedirs(LOG_DIR, exist_ok=True)
+    
+    # Log message format (timestamp - level - name - message)
+    formatter = logging.Formatter(
+        fmt='%(asctime)s - [%(levelname)s] - %(name)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    
+    # One file handler for the whole process (writes to logs/support_pilot.log)
+    file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(logging.INFO)
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Confirmation message (helps verify logger initialization). Printed once
+    # per process, not per logger: loggers of lazily imported modules would
+    # otherwise print over whatever prompt is on screen at that moment.
+    print(f"📋 [Logger] Configured. Output file: {LOG_FILE}")
+    
+    return log_queue
+
 
+@functools.lru_cache(maxsize=None)
 def setup_logger(name: str = "SupportPilot") -> logging.Logger:
     """
     Configures and returns a logger with file and console handlers.
@@ -42,8 +96,12 @@ def setup_logger(name: str = "SupportPilot") -> logging.Logger:
     
     Features:
         - Automatic log directory creation
+        - Non-blocking: records are queued and written by a background thread
+          (see get_log_queue)
         - UTF-8 encoding for international character support
         - Prevents duplicate handlers on re-initialization
+        - Memoized per name: repeated calls return the cached logger without
+          touching the filesystem or handler list again
         - Structured format: timestamp - [level] - name - message
     
     Example:
@@ -51,34 +109,17 @@ def setup_logger(name: str = "SupportPilot") -> logging.Logger:
         >>> logger.info("Ticket created successfully")
         2025-01-15 10:30:45 - [INFO] - TicketAgent - Ticket created successfully
     """
-    # 1. Ensure the 'logs' directory exists in the project root
-    log_dir = "logs"
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # 2. Get or create logger instance
+    # 1. Get or create logger instance
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)  # Capture INFO level and above
     
-    # 3. Prevent duplicate handlers if logger already configured
+    # 2. Prevent duplicate handlers if logger already configured
     if logger.hasHandlers():
         return logger
     
-    # 4. Define log message format (timestamp - level - name - message)
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - [%(levelname)s] - %(name)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # 5. Configure file handler (writes to logs/support_pilot.log)
-    log_file_path = os.path.join(log_dir, "support_pilot.log")
-    file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.INFO)
-    
-    # 6. Attach handler to logger
-    logger.addHandler(file_handler)
-    
-    # 7. Confirmation message (helps verify logger initialization)
-    print(f"📋 [Logger] Configured. Output file: {log_file_path}")
+    # 3. Attach a queue handler (the shared listener writes to the file)
+    queue_handler = QueueHandler(get_log_queue())
+    queue_handler.setLevel(logging.INFO)
+    logger.addHandler(queue_handler)
     
     return logger
\ No newline at end of file
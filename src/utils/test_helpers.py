@@ -85,22 +85,22 @@ async def run_session(
     
     app_name = runner_instance.app_name
     
-    # 1. Create or resume session
-    try:
+    # 1. Resume session, or create it if it does not exist yet
+    # (get_session returns None on a miss, so no exception path is needed)
+    session = await session_service.get_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_name
+    )
+    if session is not None:
+        logger.info(f"Resumed existing session: {session.id}")
+    else:
         session = await session_service.create_session(
             app_name=app_name,
             user_id=user_id,
             session_id=session_name
         )
         logger.info(f"Created new session: {session.id}")
-    except Exception:
-        # Session already exists, resume it
-        session = await session_service.get_session(
-            app_name=app_name,
-            user_id=user_id,
-            session_id=session_name
-        )
-        logger.info(f"Resumed existing session: {session.id}")
     
     # 2. Process user queries if provided
     if user_queries: